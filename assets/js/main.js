@@ -76,12 +76,13 @@ const TD_CONFIG = {
 };
 
 // ===== UTM & TRACKING =====
+const UTM_KEYS = ['utm_source', 'utm_medium', 'utm_campaign', 'utm_content', 'utm_term', 'gclid', 'msclkid'];
+
 (function captureUTM() {
   try {
     const params = new URLSearchParams(window.location.search);
-    const keys = ['utm_source', 'utm_medium', 'utm_campaign', 'utm_content', 'utm_term', 'gclid', 'msclkid'];
     const stored = JSON.parse(sessionStorage.getItem('td_utm') || '{}');
-    keys.forEach(function(k) {
+    UTM_KEYS.forEach(function(k) {
       const v = params.get(k);
       if (v) stored[k] = v;
     });
@@ -95,13 +96,16 @@ function getUTMData() {
 }
 
 // ===== UTILITY FUNCTIONS =====
+// Shared formatter; constructing one per call is slow on slider input events
+const CURRENCY_FORMATTER = new Intl.NumberFormat('en-US', {
+  style: 'currency',
+  currency: 'USD',
+  minimumFractionDigits: 0,
+  maximumFractionDigits: 0
+});
+
 function formatCurrency(amount) {
-  return new Intl.NumberFormat('en-US', {
-    style: 'currency',
-    currency: 'USD',
-    minimumFractionDigits: 0,
-    maximumFractionDigits: 0
-  }).format(amount);
+  return CURRENCY_FORMATTER.format(amount);
 }
 
 function formatCompactCurrency(amount) {
@@ -123,6 +127,10 @@ function updateSliderTrack(slider) {
 }
 
 // ===== MOBILE NAVIGATION =====
+// Icon markup for the menu button: hamburger when closed, X when open
+const MENU_ICON_OPEN = '<path d="M3 12h18M3 6h18M3 18h18" stroke-linecap="round"/>';
+const MENU_ICON_CLOSE = '<path d="M6 18L18 6M6 6l12 12" stroke-linecap="round"/>';
+
 function initMobileNav() {
   const mobileMenuBtn = document.getElementById('mobile-menu-btn');
   const nav = document.getElementById('main-nav');
@@ -134,7 +142,7 @@ function initMobileNav() {
     mobileMenuBtn.setAttribute('aria-expanded', 'false');
     const icon = mobileMenuBtn.querySelector('svg');
     if (icon) {
-      icon.innerHTML = '<path d="M3 12h18M3 6h18M3 18h18" stroke-linecap="round"/>';
+      icon.innerHTML = MENU_ICON_OPEN;
     }
   }
 
@@ -143,7 +151,7 @@ function initMobileNav() {
     mobileMenuBtn.setAttribute('aria-expanded', 'true');
     const icon = mobileMenuBtn.querySelector('svg');
     if (icon) {
-      icon.innerHTML = '<path d="M6 18L18 6M6 6l12 12" stroke-linecap="round"/>';
+      icon.innerHTML = MENU_ICON_CLOSE;
     }
   }
 
@@ -315,6 +323,12 @@ function initProcessAccordion() {
 }
 
 // ===== GENERIC FORM HANDLER =====
+// Optional form fields sent to /api/lead under "extra" when filled in
+const EXTRA_FORM_FIELDS = [
+  'message', 'property_address', 'home_details', 'referred_by',
+  'experience', 'interest', 'transaction_type'
+];
+
 function initFormHandler(formId, successMessage) {
   const form = document.getElementById(formId);
   if (!form) return;
@@ -343,7 +357,7 @@ function initFormHandler(formId, successMessage) {
 
     requiredFields.forEach(field => {
       const errorEl = document.getElementById(field.id + '-error');
-      const isEmpty = field.type === 'checkbox' ? !field.checked : (!field.value || field.value === '');
+      const isEmpty = field.type === 'checkbox' ? !field.checked : !field.value.trim();
       if (isEmpty) {
         isValid = false;
         field.classList.add('error');
@@ -361,7 +375,7 @@ function initFormHandler(formId, successMessage) {
   form.querySelectorAll('[required]').forEach(field => {
     field.addEventListener('change', () => {
       const errorEl = document.getElementById(field.id + '-error');
-      if (field.value && field.value !== '') {
+      if (field.value.trim()) {
         field.classList.remove('error');
         if (errorEl) errorEl.style.display = 'none';
       }
@@ -423,13 +437,16 @@ function initFormHandler(formId, successMessage) {
 
     // Collect form-specific extra fields
     const extra = {};
-    if (formData.get('message')) extra.message = formData.get('message');
-    if (formData.get('property_address')) extra.property_address = formData.get('property_address');
-    if (formData.get('home_details')) extra.home_details = formData.get('home_details');
-    if (formData.get('referred_by')) extra.referred_by = formData.get('referred_by');
-    if (formData.get('experience')) extra.experience = formData.get('experience');
-    if (formData.get('interest')) extra.interest = formData.get('interest');
-    if (formData.get('transaction_type')) extra.transaction_type = formData.get('transaction_type');
+    EXTRA_FORM_FIELDS.forEach(k => {
+      const v = formData.get(k);
+      if (v) extra[k] = v;
+    });
+
+    // Stored UTM / click IDs, defaulting to empty strings
+    const utmFields = {};
+    UTM_KEYS.forEach(k => {
+      utmFields[k] = utm[k] || '';
+    });
 
     const payload = {
       name: fullName,
@@ -444,13 +461,7 @@ function initFormHandler(formId, successMessage) {
       intent_type: intentType,
       intent_strength: 'medium',
       event_name: eventName,
-      utm_source: utm.utm_source || '',
-      utm_medium: utm.utm_medium || '',
-      utm_campaign: utm.utm_campaign || '',
-      utm_content: utm.utm_content || '',
-      utm_term: utm.utm_term || '',
-      gclid: utm.gclid || '',
-      msclkid: utm.msclkid || '',
+      ...utmFields,
       extra: extra,
     };
 
@@ -1,6 +1,7 @@
 /**
  * POST /api/lead — First-party lead capture endpoint
- * Stores leads in Cloudflare KV (LEADS namespace) and forwards to Formspree.
+ * Stores leads in Cloudflare KV (LEADS namespace) and forwards to Formspree
+ * in the background once the response has been returned.
  */
 
 const ALLOWED_ORIGINS = [
@@ -13,6 +14,23 @@ const ALLOWED_ORIGINS = [
 
 const EMAIL_RE = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
 
+const FORMSPREE_ENDPOINT = 'https://formspree.io/f/mykkypyd';
+const LEAD_TTL_SECONDS = 90 * 24 * 60 * 60; // 90 days
+
+// Lead fields always forwarded to Formspree, in submission order
+const FORMSPREE_FIELDS = ['name', 'email', 'phone', 'event_name', 'intent_type', 'page_path', 'lead_id'];
+
+// Form-specific extra fields, forwarded only when present
+const FORMSPREE_EXTRA_FIELDS = [
+  'message',
+  'property_address',
+  'referred_by',
+  'experience',
+  'interest',
+  'home_details',
+  'transaction_type',
+];
+
 // Simple in-memory rate limiter (per-isolate, resets on cold start)
 const rateLimiter = new Map();
 const RATE_LIMIT_WINDOW = 60_000; // 1 minute
@@ -39,6 +57,30 @@ function corsHeaders(origin) {
   };
 }
 
+async function forwardToFormspree(lead) {
+  try {
+    const formspreeBody = new URLSearchParams();
+    for (const field of FORMSPREE_FIELDS) {
+      formspreeBody.append(field, lead[field]);
+    }
+    for (const field of FORMSPREE_EXTRA_FIELDS) {
+      if (lead.extra[field]) formspreeBody.append(field, lead.extra[field]);
+    }
+    if (lead.utm_source) formspreeBody.append('utm_source', lead.utm_source);
+
+    const response = await fetch(FORMSPREE_ENDPOINT, {
+      method: 'POST',
+      body: formspreeBody,
+      headers: { 'Accept': 'application/json' },
+    });
+    if (!response.ok) {
+      console.error('Formspree forward failed: HTTP', response.status);
+    }
+  } catch (err) {
+    console.error('Formspree forward failed:', err);
+  }
+}
+
 export async function onRequestGet() {
   return new Response(JSON.stringify({ status: 'ok', method: 'POST required' }), {
     status: 405,
@@ -157,7 +199,7 @@ export async function onRequestPost(context) {
   try {
     if (env.LEADS) {
       await env.LEADS.put(kvKey, JSON.stringify(lead), {
-        expirationTtl: 90 * 24 * 60 * 60, // 90 days in seconds
+        expirationTtl: LEAD_TTL_SECONDS,
       });
     }
   } catch (err) {
@@ -165,33 +207,8 @@ export async function onRequestPost(context) {
     console.error('KV write failed:', err);
   }
 
-  // Forward to Formspree as fallback/parallel delivery
-  try {
-    const formspreeBody = new URLSearchParams();
-    formspreeBody.append('name', lead.name);
-    formspreeBody.append('email', lead.email);
-    formspreeBody.append('phone', lead.phone);
-    formspreeBody.append('event_name', lead.event_name);
-    formspreeBody.append('intent_type', lead.intent_type);
-    formspreeBody.append('page_path', lead.page_path);
-    formspreeBody.append('lead_id', lead.lead_id);
-    if (lead.extra.message) formspreeBody.append('message', lead.extra.message);
-    if (lead.extra.property_address) formspreeBody.append('property_address', lead.extra.property_address);
-    if (lead.extra.referred_by) formspreeBody.append('referred_by', lead.extra.referred_by);
-    if (lead.extra.experience) formspreeBody.append('experience', lead.extra.experience);
-    if (lead.extra.interest) formspreeBody.append('interest', lead.extra.interest);
-    if (lead.extra.home_details) formspreeBody.append('home_details', lead.extra.home_details);
-    if (lead.extra.transaction_type) formspreeBody.append('transaction_type', lead.extra.transaction_type);
-    if (lead.utm_source) formspreeBody.append('utm_source', lead.utm_source);
-
-    await fetch('https://formspree.io/f/mykkypyd', {
-      method: 'POST',
-      body: formspreeBody,
-      headers: { 'Accept': 'application/json' },
-    });
-  } catch (err) {
-    console.error('Formspree forward failed:', err);
-  }
+  // Forward to Formspree as fallback/parallel delivery, after the response is sent
+  context.waitUntil(forwardToFormspree(lead));
 
   return new Response(JSON.stringify({ ok: true, lead_id: leadId }), {
     status: 200,
@@ -3,6 +3,68 @@
  * Requires X-Export-Key header matching the EXPORT_KEY secret.
  */
 
+// Maximum number of keys accepted by a single KV bulk get
+const KV_BULK_GET_LIMIT = 100;
+
+/**
+ * Yield stored leads one KV list page at a time, in key (created_at) order.
+ */
+async function* leadPages(kv) {
+  let cursor = undefined;
+
+  // Paginate through all KV keys with prefix "lead:"
+  do {
+    const listResult = await kv.list({ prefix: 'lead:', cursor, limit: 1000 });
+    const names = listResult.keys.map((key) => key.name);
+
+    // Bulk-read values in batches instead of one KV call per key
+    const batches = [];
+    for (let i = 0; i < names.length; i += KV_BULK_GET_LIMIT) {
+      batches.push(names.slice(i, i + KV_BULK_GET_LIMIT));
+    }
+    const results = await Promise.all(
+      batches.map((batch) => kv.get(batch, { type: 'json' }))
+    );
+
+    // Keep list order (keys sort by created_at)
+    const leads = [];
+    batches.forEach((batch, i) => {
+      for (const name of batch) {
+        const val = results[i].get(name);
+        if (val) leads.push(val);
+      }
+    });
+    yield leads;
+
+    cursor = listResult.list_complete ? undefined : listResult.cursor;
+  } while (cursor);
+}
+
+/**
+ * Write lead pages to the response stream as a single JSON array.
+ */
+async function writeLeads(pages, writable) {
+  const writer = writable.getWriter();
+  const encoder = new TextEncoder();
+  let first = true;
+
+  try {
+    await writer.write(encoder.encode('['));
+    for await (const leads of pages) {
+      if (leads.length === 0) continue;
+      const chunk = leads.map((lead) => JSON.stringify(lead)).join(',');
+      await writer.write(encoder.encode((first ? '' : ',') + chunk));
+      first = false;
+    }
+    await writer.write(encoder.encode(']'));
+    await writer.close();
+  } catch (err) {
+    // Headers are already sent; abort so the client sees a truncated body
+    console.error('Lead export failed:', err);
+    await writer.abort(err);
+  }
+}
+
 export async function onRequestGet(context) {
   const { request, env } = context;
 
@@ -24,23 +86,11 @@ export async function onRequestGet(context) {
     });
   }
 
-  const leads = [];
-  let cursor = undefined;
-
-  // Paginate through all KV keys with prefix "lead:"
-  do {
-    const listResult = await env.LEADS.list({ prefix: 'lead:', cursor, limit: 1000 });
-    const values = await Promise.all(
-      listResult.keys.map(async (key) => {
-        const val = await env.LEADS.get(key.name, { type: 'json' });
-        return val;
-      })
-    );
-    leads.push(...values.filter(Boolean));
-    cursor = listResult.list_complete ? undefined : listResult.cursor;
-  } while (cursor);
+  // Stream the array page by page instead of buffering every lead in memory
+  const { readable, writable } = new TransformStream();
+  context.waitUntil(writeLeads(leadPages(env.LEADS), writable));
 
-  return new Response(JSON.stringify(leads, null, 2), {
+  return new Response(readable, {
     status: 200,
     headers: {
       'Content-Type': 'application/json',
@@ -11,6 +11,7 @@ import { fileURLToPath } from 'url';
 const __dirname = dirname(fileURLToPath(import.meta.url));
 const ROOT = join(__dirname, '..');
 const SITE_URL = 'https://tdrealtyohio.com';
+const CANONICAL_RE = /<link[^>]*rel=["']canonical["'][^>]*href=["']([^"']+)["']/i;
 
 // Priority mapping based on page type
 const PRIORITY_MAP = {
@@ -51,7 +52,7 @@ const EXCLUDE = ['/404.html', '/404/', '/lp/'];
 async function getCanonicalUrl(filePath) {
   try {
     const content = await readFile(filePath, 'utf-8');
-    const match = content.match(/<link[^>]*rel=["']canonical["'][^>]*href=["']([^"']+)["']/i);
+    const match = content.match(CANONICAL_RE);
     if (match) {
       return match[1];
     }
@@ -130,17 +131,17 @@ async function generateSitemap() {
   console.log('Generating sitemap.xml...');
 
   const htmlFiles = await findHtmlFiles(ROOT);
-  const urls = [];
 
-  for (const filePath of htmlFiles) {
+  // Stat all pages concurrently rather than one await per file
+  const entries = await Promise.all(htmlFiles.map(async (filePath) => {
     const canonicalUrl = filePathToCanonicalUrl(filePath);
 
-    if (!canonicalUrl) continue;
+    if (!canonicalUrl) return null;
 
     // Check if excluded
     const path = canonicalUrl.replace(SITE_URL, '');
     if (EXCLUDE.some(ex => path === ex || path.startsWith(ex.replace('.html', '')))) {
-      continue;
+      return null;
     }
 
     const lastmod = await getLastMod(filePath);
@@ -149,13 +150,14 @@ async function generateSitemap() {
                        path === '/' ? 'weekly' :
                        ['privacy', 'terms', 'fair-housing'].some(p => path.includes(p)) ? 'yearly' : 'monthly';
 
-    urls.push({
+    return {
       loc: canonicalUrl,
       lastmod,
       changefreq,
       priority
-    });
-  }
+    };
+  }));
+  const urls = entries.filter(Boolean);
 
   // Sort by priority (descending) then alphabetically
   urls.sort((a, b) => {
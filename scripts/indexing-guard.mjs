@@ -11,12 +11,21 @@ import { fileURLToPath } from 'url';
 const __dirname = dirname(fileURLToPath(import.meta.url));
 const ROOT = join(__dirname, '..');
 const SITE_URL = 'https://tdrealtyohio.com';
+const CANONICAL_RE = /<link[^>]*rel=["']canonical["'][^>]*href=["']([^"']+)["']/i;
 const OLD_PHONE = '614-956-8656';
 const OLD_PHONE_VARIANTS = ['614-956-8656', '614.956.8656', '(614) 956-8656', '6149568656'];
+// One pass over each file finds every variant
+const OLD_PHONE_RE = new RegExp(
+  OLD_PHONE_VARIANTS.map(v => v.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')).join('|'),
+  'g'
+);
 
 let errors = [];
 let warnings = [];
 
+// Pending or completed reads, keyed by path
+const fileContents = new Map();
+
 /**
  * Check if a file exists
  */
@@ -29,6 +38,18 @@ async function fileExists(path) {
   }
 }
 
+/**
+ * Read a file as UTF-8, sharing one read per path across checks
+ */
+function readText(path) {
+  let content = fileContents.get(path);
+  if (!content) {
+    content = readFile(path, 'utf-8');
+    fileContents.set(path, content);
+  }
+  return content;
+}
+
 /**
  * Recursively find all files with given extensions
  */
@@ -116,17 +137,18 @@ async function checkSitemapXml() {
 async function checkCanonicals() {
   console.log('Checking canonical tags...');
   const htmlFiles = await findFiles(ROOT, ['.html']);
+  const contents = await Promise.all(htmlFiles.map(readText));
 
-  for (const filePath of htmlFiles) {
+  for (const [i, filePath] of htmlFiles.entries()) {
     const relativePath = filePath.replace(ROOT, '');
 
     // Skip 404 page
     if (relativePath.includes('404')) continue;
 
-    const content = await readFile(filePath, 'utf-8');
+    const content = contents[i];
 
     // Check for canonical link
-    const canonicalMatch = content.match(/<link[^>]*rel=["']canonical["'][^>]*href=["']([^"']+)["']/i);
+    const canonicalMatch = content.match(CANONICAL_RE);
 
     if (!canonicalMatch) {
       errors.push(`Missing canonical tag: ${relativePath}`);
@@ -161,13 +183,15 @@ async function checkOldPhoneNumber() {
   console.log('Checking for old phone number...');
   // Exclude .md files as they may contain documentation about the old number
   const allFiles = await findFiles(ROOT, ['.html', '.js', '.json', '.css']);
+  const contents = await Promise.all(allFiles.map(readText));
 
-  for (const filePath of allFiles) {
-    const content = await readFile(filePath, 'utf-8');
+  for (const [i, filePath] of allFiles.entries()) {
+    const content = contents[i];
     const relativePath = filePath.replace(ROOT, '');
 
+    const found = new Set(content.match(OLD_PHONE_RE));
     for (const variant of OLD_PHONE_VARIANTS) {
-      if (content.includes(variant)) {
+      if (found.has(variant)) {
         errors.push(`Old phone number found in ${relativePath}: ${variant}`);
       }
     }
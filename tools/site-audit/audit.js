@@ -18,6 +18,13 @@ const HTML_EXTENSIONS = ['.html'];
 const WARNINGS = [];
 const PASSES = [];
 
+// Patterns applied to every file, compiled once
+// Match href="/something.html" (internal links with .html extension)
+const INTERNAL_HTML_LINK_RE = /href="\/[^"]*\.html"/g;
+const ARIA_CONTROLS_RE = /mobile-menu-btn[^>]*aria-controls=/i;
+const ARIA_EXPANDED_RE = /mobile-menu-btn[^>]*aria-expanded=/i;
+const SLIDER_VALUE_VAR_RE = /slider-runnable-track[^}]*var\(--value/i;
+
 // Colors for console output
 const RED = '\x1b[31m';
 const GREEN = '\x1b[32m';
@@ -53,9 +60,7 @@ function findHtmlFiles(dir, files = []) {
  */
 function checkInternalHtmlLinks(filePath, content) {
   const relativePath = path.relative(ROOT_DIR, filePath);
-  // Match href="/something.html" (internal links with .html extension)
-  const internalHtmlLinkRegex = /href="\/[^"]*\.html"/g;
-  const matches = content.match(internalHtmlLinkRegex);
+  const matches = content.match(INTERNAL_HTML_LINK_RE);
 
   if (matches && matches.length > 0) {
     WARNINGS.push({
@@ -75,8 +80,8 @@ function checkHamburgerAria(filePath, content) {
   // Look for mobile menu button
   if (content.includes('mobile-menu-btn')) {
     // Check if it has aria-controls
-    const hasAriaControls = /mobile-menu-btn[^>]*aria-controls=/i.test(content);
-    const hasAriaExpanded = /mobile-menu-btn[^>]*aria-expanded=/i.test(content);
+    const hasAriaControls = ARIA_CONTROLS_RE.test(content);
+    const hasAriaExpanded = ARIA_EXPANDED_RE.test(content);
 
     if (!hasAriaControls) {
       WARNINGS.push({
@@ -107,7 +112,7 @@ function checkSliderTrack(filePath, content) {
   // Only check CSS files or inline styles in HTML
   if (content.includes('calculator-range') && content.includes('-webkit-slider-runnable-track')) {
     // Check if track uses --value variable
-    const hasValueVariable = /slider-runnable-track[^}]*var\(--value/i.test(content);
+    const hasValueVariable = SLIDER_VALUE_VAR_RE.test(content);
 
     if (!hasValueVariable) {
       WARNINGS.push({
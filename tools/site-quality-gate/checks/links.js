@@ -4,8 +4,7 @@
  */
 
 const path = require('path');
-const cheerio = require('cheerio');
-const { getHtmlFiles, readHtmlFile, isExternalUrl, localFileExists } = require('./utils');
+const { getHtmlFiles, loadHtml, isExternalUrl, isNonNavigableHref, localFileExists } = require('./utils');
 
 async function checkLinks(config, verbose) {
   const result = {
@@ -28,8 +27,7 @@ async function checkLinks(config, verbose) {
   const externalUrls = new Map(); // url -> [files that reference it]
 
   for (const file of files) {
-    const html = readHtmlFile(file.absolute);
-    const $ = cheerio.load(html);
+    const $ = loadHtml(file.absolute);
 
     // Check all anchor tags
     $('a[href]').each((i, el) => {
@@ -39,8 +37,7 @@ async function checkLinks(config, verbose) {
       result.stats.totalLinks++;
 
       // Skip anchors, mailto, tel, javascript
-      if (href.startsWith('#') || href.startsWith('mailto:') ||
-          href.startsWith('tel:') || href.startsWith('javascript:')) {
+      if (isNonNavigableHref(href)) {
         return;
       }
 
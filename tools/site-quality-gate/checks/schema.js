@@ -3,8 +3,7 @@
  * Validates JSON-LD structured data on pages
  */
 
-const cheerio = require('cheerio');
-const { getHtmlFiles, readHtmlFile } = require('./utils');
+const { getHtmlFiles, loadHtml } = require('./utils');
 
 // Required schema types for specific page types
 const REQUIRED_SCHEMAS = {
@@ -77,7 +76,7 @@ function validateFAQPageSchema(schema) {
 
   for (let i = 0; i < schema.mainEntity.length; i++) {
     const qa = schema.mainEntity[i];
-    if (!qa.name && !qa['@type'] === 'Question') {
+    if (!qa.name) {
       errors.push(`FAQPage question ${i + 1} missing "name"`);
     }
     if (!qa.acceptedAnswer) {
@@ -125,6 +124,14 @@ function validateArticleSchema(schema) {
   return errors;
 }
 
+// Validators keyed by schema @type
+const SCHEMA_VALIDATORS = new Map([
+  ['RealEstateAgent', validateRealEstateAgentSchema],
+  ['FAQPage', validateFAQPageSchema],
+  ['BreadcrumbList', validateBreadcrumbSchema],
+  ['Article', validateArticleSchema]
+]);
+
 async function checkSchema(config, verbose) {
   const result = {
     passed: true,
@@ -148,8 +155,7 @@ async function checkSchema(config, verbose) {
       continue;
     }
 
-    const html = readHtmlFile(file.absolute);
-    const $ = cheerio.load(html);
+    const $ = loadHtml(file.absolute);
     const schemas = parseJsonLd($);
     const types = getSchemaTypes(schemas);
 
@@ -169,45 +175,14 @@ async function checkSchema(config, verbose) {
     // Validate specific schema types
     for (const schema of schemas) {
       const schemaType = schema['@type'];
-
-      if (schemaType === 'RealEstateAgent') {
-        const validationErrors = validateRealEstateAgentSchema(schema);
-        for (const err of validationErrors) {
-          result.warnings.push({
-            file: file.relative,
-            message: err
-          });
-        }
-      }
-
-      if (schemaType === 'FAQPage') {
-        const validationErrors = validateFAQPageSchema(schema);
-        for (const err of validationErrors) {
-          result.warnings.push({
-            file: file.relative,
-            message: err
-          });
-        }
-      }
-
-      if (schemaType === 'BreadcrumbList') {
-        const validationErrors = validateBreadcrumbSchema(schema);
-        for (const err of validationErrors) {
-          result.warnings.push({
-            file: file.relative,
-            message: err
-          });
-        }
-      }
-
-      if (schemaType === 'Article') {
-        const validationErrors = validateArticleSchema(schema);
-        for (const err of validationErrors) {
-          result.warnings.push({
-            file: file.relative,
-            message: err
-          });
-        }
+      const validate = SCHEMA_VALIDATORS.get(schemaType);
+      if (!validate) continue;
+
+      for (const err of validate(schema)) {
+        result.warnings.push({
+          file: file.relative,
+          message: err
+        });
       }
     }
 
@@ -4,8 +4,87 @@
  */
 
 const path = require('path');
-const cheerio = require('cheerio');
-const { getHtmlFiles, readHtmlFile } = require('./utils');
+const { getHtmlFiles, loadHtml } = require('./utils');
+
+function validateTitle(element, file, result) {
+  const title = element.text().trim();
+  if (!title) {
+    result.errors.push({
+      file: file.relative,
+      message: 'Empty title tag'
+    });
+    result.passed = false;
+  } else if (title.length < 10) {
+    result.warnings.push({
+      file: file.relative,
+      message: `Title tag may be too short: "${title}"`
+    });
+  } else if (title.length > 60) {
+    result.warnings.push({
+      file: file.relative,
+      message: `Title tag may be too long (${title.length} chars): "${title.substring(0, 50)}..."`
+    });
+  }
+}
+
+function validateDescription(element, file, result) {
+  const content = element.attr('content');
+  if (!content) {
+    result.errors.push({
+      file: file.relative,
+      message: 'Empty meta description'
+    });
+    result.passed = false;
+  } else if (content.length < 50) {
+    result.warnings.push({
+      file: file.relative,
+      message: `Meta description may be too short (${content.length} chars)`
+    });
+  } else if (content.length > 160) {
+    result.warnings.push({
+      file: file.relative,
+      message: `Meta description may be too long (${content.length} chars)`
+    });
+  }
+}
+
+function validateCanonical(element, file, result) {
+  const href = element.attr('href');
+  if (!href) {
+    result.errors.push({
+      file: file.relative,
+      message: 'Canonical tag missing href'
+    });
+    result.passed = false;
+  } else if (!href.startsWith('https://')) {
+    result.warnings.push({
+      file: file.relative,
+      message: `Canonical should use https: ${href}`
+    });
+  }
+}
+
+function validateOpenGraph(element, file, result, selector) {
+  const content = element.attr('content');
+  if (!content) {
+    result.errors.push({
+      file: file.relative,
+      message: `Empty Open Graph tag: ${selector}`
+    });
+    result.passed = false;
+  }
+}
+
+/**
+ * Pick the content validator for a required selector (null if presence is enough)
+ */
+function resolveValidator(selector) {
+  if (selector === 'title') return validateTitle;
+  if (selector.includes('meta[name="description"]')) return validateDescription;
+  if (selector.includes('link[rel="canonical"]')) return validateCanonical;
+  if (selector.includes('meta[property="og:')) return validateOpenGraph;
+  return null;
+}
 
 async function checkSeo(config, verbose) {
   const result = {
@@ -22,17 +101,22 @@ async function checkSeo(config, verbose) {
   const excludeFromSeo = config.excludeFromSeoCheck || [];
   result.stats.filesChecked = files.length;
 
+  // Resolve each selector's validator once instead of per page
+  const seoTags = config.requiredSeoTags.map(selector => ({
+    selector,
+    validate: resolveValidator(selector)
+  }));
+
   for (const file of files) {
     // Skip files excluded from SEO checks (like 404.html)
     if (excludeFromSeo.some(f => file.relative === f || file.relative.endsWith('/' + f))) {
       continue;
     }
 
-    const html = readHtmlFile(file.absolute);
-    const $ = cheerio.load(html);
+    const $ = loadHtml(file.absolute);
 
     // Check each required SEO tag
-    for (const selector of config.requiredSeoTags) {
+    for (const { selector, validate } of seoTags) {
       const element = $(selector);
 
       if (element.length === 0) {
@@ -46,67 +130,8 @@ async function checkSeo(config, verbose) {
       }
 
       // Validate tag has content
-      if (selector === 'title') {
-        const title = element.text().trim();
-        if (!title) {
-          result.errors.push({
-            file: file.relative,
-            message: 'Empty title tag'
-          });
-          result.passed = false;
-        } else if (title.length < 10) {
-          result.warnings.push({
-            file: file.relative,
-            message: `Title tag may be too short: "${title}"`
-          });
-        } else if (title.length > 60) {
-          result.warnings.push({
-            file: file.relative,
-            message: `Title tag may be too long (${title.length} chars): "${title.substring(0, 50)}..."`
-          });
-        }
-      } else if (selector.includes('meta[name="description"]')) {
-        const content = element.attr('content');
-        if (!content) {
-          result.errors.push({
-            file: file.relative,
-            message: 'Empty meta description'
-          });
-          result.passed = false;
-        } else if (content.length < 50) {
-          result.warnings.push({
-            file: file.relative,
-            message: `Meta description may be too short (${content.length} chars)`
-          });
-        } else if (content.length > 160) {
-          result.warnings.push({
-            file: file.relative,
-            message: `Meta description may be too long (${content.length} chars)`
-          });
-        }
-      } else if (selector.includes('link[rel="canonical"]')) {
-        const href = element.attr('href');
-        if (!href) {
-          result.errors.push({
-            file: file.relative,
-            message: 'Canonical tag missing href'
-          });
-          result.passed = false;
-        } else if (!href.startsWith('https://')) {
-          result.warnings.push({
-            file: file.relative,
-            message: `Canonical should use https: ${href}`
-          });
-        }
-      } else if (selector.includes('meta[property="og:')) {
-        const content = element.attr('content');
-        if (!content) {
-          result.errors.push({
-            file: file.relative,
-            message: `Empty Open Graph tag: ${selector}`
-          });
-          result.passed = false;
-        }
+      if (validate) {
+        validate(element, file, result, selector);
       }
     }
 
@@ -38,14 +38,31 @@ async function checkSitemap(config, verbose) {
   const sitemapXml = fs.readFileSync(sitemapPath, 'utf-8');
   const $ = cheerio.load(sitemapXml, { xmlMode: true });
 
-  // Extract URLs from sitemap
+  // Extract URLs and validate lastmod dates in a single pass over <url>
   const sitemapUrls = new Set();
-  $('url loc').each((i, el) => {
-    let url = $(el).text().trim();
-    // Normalize URL
-    url = url.replace(config.baseUrl, '');
-    url = url.replace(/\/$/, '') || '/';
-    sitemapUrls.add(url);
+  const lastmodErrors = [];
+  $('url').each((i, el) => {
+    const entry = $(el);
+    const loc = entry.find('loc').text();
+    const lastmod = entry.find('lastmod').text();
+
+    if (loc) {
+      // Normalize URL
+      let url = loc.trim();
+      url = url.replace(config.baseUrl, '');
+      url = url.replace(/\/$/, '') || '/';
+      sitemapUrls.add(url);
+    }
+
+    if (lastmod) {
+      const date = new Date(lastmod);
+      if (isNaN(date.getTime())) {
+        lastmodErrors.push({
+          file: config.sitemapFile,
+          message: `Invalid lastmod date for ${loc}: ${lastmod}`
+        });
+      }
+    }
   });
 
   result.stats.sitemapUrls = sitemapUrls.size;
@@ -126,22 +143,11 @@ async function checkSitemap(config, verbose) {
     }
   }
 
-  // Check for valid lastmod dates
-  $('url').each((i, el) => {
-    const loc = $(el).find('loc').text();
-    const lastmod = $(el).find('lastmod').text();
-
-    if (lastmod) {
-      const date = new Date(lastmod);
-      if (isNaN(date.getTime())) {
-        result.errors.push({
-          file: config.sitemapFile,
-          message: `Invalid lastmod date for ${loc}: ${lastmod}`
-        });
-        result.passed = false;
-      }
-    }
-  });
+  // Report invalid lastmod dates collected above
+  if (lastmodErrors.length > 0) {
+    result.errors.push(...lastmodErrors);
+    result.passed = false;
+  }
 
   return result;
 }
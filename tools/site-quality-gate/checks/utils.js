@@ -4,12 +4,37 @@
 
 const fs = require('fs');
 const path = require('path');
+const cheerio = require('cheerio');
 const { glob } = require('glob');
 
+// Parsed documents, shared by every check in a single run
+const documentCache = new Map();
+
+// File listings per config, so the site is globbed once per run
+const fileListCache = new WeakMap();
+
+// Hostnames of base URLs, which are compared against every link
+const hostnameCache = new Map();
+
+// Resolved link targets already checked on disk (nav links repeat on every page)
+const existenceCache = new Map();
+
+// Anchors and non-HTTP schemes that never resolve to a page
+const NON_NAVIGABLE_RE = /^(?:#|mailto:|tel:|javascript:)/;
+
 /**
  * Get all HTML files in the site
  */
-async function getHtmlFiles(config) {
+function getHtmlFiles(config) {
+  let files = fileListCache.get(config);
+  if (!files) {
+    files = findHtmlFiles(config);
+    fileListCache.set(config, files);
+  }
+  return files;
+}
+
+async function findHtmlFiles(config) {
   const siteRoot = path.resolve(__dirname, '..', config.siteRoot);
   const pattern = path.join(siteRoot, config.htmlGlob);
 
@@ -30,6 +55,19 @@ function readHtmlFile(filePath) {
   return fs.readFileSync(filePath, 'utf-8');
 }
 
+/**
+ * Load an HTML file into cheerio, parsing each file at most once per run.
+ * Checks only read from the returned document, so it is safe to share.
+ */
+function loadHtml(filePath) {
+  let $ = documentCache.get(filePath);
+  if (!$) {
+    $ = cheerio.load(readHtmlFile(filePath));
+    documentCache.set(filePath, $);
+  }
+  return $;
+}
+
 /**
  * Normalize a URL for comparison
  */
@@ -52,20 +90,34 @@ function normalizeUrl(url, baseUrl) {
   return url;
 }
 
+/**
+ * Check if an href is an anchor or a non-HTTP scheme (mailto, tel, javascript)
+ */
+function isNonNavigableHref(href) {
+  return NON_NAVIGABLE_RE.test(href);
+}
+
+/**
+ * Get the hostname of a base URL, parsing each base once
+ */
+function getHostname(baseUrl) {
+  let hostname = hostnameCache.get(baseUrl);
+  if (hostname === undefined) {
+    hostname = new URL(baseUrl).hostname;
+    hostnameCache.set(baseUrl, hostname);
+  }
+  return hostname;
+}
+
 /**
  * Check if a URL is external
  */
 function isExternalUrl(url, baseUrl) {
-  if (!url) return false;
-  if (url.startsWith('#')) return false;
-  if (url.startsWith('mailto:')) return false;
-  if (url.startsWith('tel:')) return false;
-  if (url.startsWith('javascript:')) return false;
+  if (!url || isNonNavigableHref(url)) return false;
 
   try {
     const urlObj = new URL(url, baseUrl);
-    const baseObj = new URL(baseUrl);
-    return urlObj.hostname !== baseObj.hostname;
+    return urlObj.hostname !== getHostname(baseUrl);
   } catch {
     return false;
   }
@@ -75,8 +127,7 @@ function isExternalUrl(url, baseUrl) {
  * Check if a local file exists
  */
 function localFileExists(href, htmlFile, siteRoot) {
-  if (!href || href.startsWith('#') || href.startsWith('mailto:') ||
-      href.startsWith('tel:') || href.startsWith('javascript:')) {
+  if (!href || isNonNavigableHref(href)) {
     return true;
   }
 
@@ -93,6 +144,18 @@ function localFileExists(href, htmlFile, siteRoot) {
   // Remove query strings and fragments
   targetPath = targetPath.split('?')[0].split('#')[0];
 
+  let exists = existenceCache.get(targetPath);
+  if (exists === undefined) {
+    exists = resolvesToFile(targetPath);
+    existenceCache.set(targetPath, exists);
+  }
+  return exists;
+}
+
+/**
+ * Check a resolved path on disk, falling back to index.html and .html
+ */
+function resolvesToFile(targetPath) {
   // Check if it's a directory (should have index.html)
   if (fs.existsSync(targetPath)) {
     const stat = fs.statSync(targetPath);
@@ -113,7 +176,9 @@ function localFileExists(href, htmlFile, siteRoot) {
 module.exports = {
   getHtmlFiles,
   readHtmlFile,
+  loadHtml,
   normalizeUrl,
+  isNonNavigableHref,
   isExternalUrl,
   localFileExists
 };
@@ -102,7 +102,7 @@ async function main() {
   console.log(`Report written to: ${reportFile}`);
 
   // Also write timestamped report
-  const timestamp = new Date().toISOString().replace(/[:.]/g, '-');
+  const timestamp = results.timestamp.replace(/[:.]/g, '-');
   const timestampedFile = path.join(reportsDir, `report-${timestamp}.json`);
   fs.writeFileSync(timestampedFile, JSON.stringify(results, null, 2));
 